@@ -5,14 +5,71 @@ For the JSON backend, generates an index.json file with metadata.
 """
 
 import argparse
+import functools
+import hashlib
 import json
 import os
 import platform
+import re
+import shutil
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+PYXIS_GIT_URL = "https://github.com/ferrobrew/pyxis.git"
+
+
+def pyxis_install_stamp_path() -> Path:
+    """Where the cache key of the last successful `cargo install` is kept,
+    along with the fingerprint of the binary it produced."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "pyxis-defs" / "installed.stamp"
+
+
+def pyxis_install_key(
+    branch: Optional[str], tag: Optional[str], rev: Optional[str], path: Optional[str]
+) -> Optional[str]:
+    """Compute a cache key identifying exactly what an install would build.
+
+    Git installs resolve the requested ref to a commit with `git ls-remote`,
+    so a moved branch invalidates the key. Returns None when no stable key
+    exists (a local `--path` checkout, whose freshness cargo already tracks,
+    or a failed remote lookup), meaning the install must always run."""
+    if path:
+        return None
+    commit = rev
+    if commit is None:
+        if branch:
+            ref = f"refs/heads/{branch}"
+        elif tag:
+            ref = f"refs/tags/{tag}"
+        else:
+            ref = "HEAD"
+        try:
+            result = subprocess.run(
+                ["git", "ls-remote", PYXIS_GIT_URL, ref],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+        except FileNotFoundError:
+            return None
+        if result.returncode != 0 or not result.stdout.strip():
+            return None
+        commit = result.stdout.split()[0]
+    key = json.dumps([branch, tag, rev, commit])
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
 
 
 def install_pyxis(
@@ -20,14 +77,32 @@ def install_pyxis(
     tag: Optional[str] = None,
     rev: Optional[str] = None,
     path: Optional[str] = None,
+    force: bool = False,
 ):
     """Install pyxis if not available.
 
+    Skips `cargo install` when the pyxis on PATH is the binary the stamp file
+    says was last installed from the same source.
+
     Args:
         branch: Optional branch name to install.
         tag: Optional tag name to install.
         rev: Optional commit revision to install.
+        path: Optional local path to install from.
+        force: Install even if the stamp says pyxis is up to date.
     """
+    stamp_file = pyxis_install_stamp_path()
+    install_key = pyxis_install_key(branch, tag, rev, path)
+    if not force and install_key is not None:
+        pyxis_fingerprint = get_pyxis_fingerprint()
+        try:
+            stamp = stamp_file.read_text(encoding="utf-8").split()
+        except OSError:
+            stamp = []
+        if pyxis_fingerprint is not None and stamp == [install_key, pyxis_fingerprint]:
+            print("pyxis is up to date, skipping install")
+            return
+
     print("Installing pyxis...")
     try:
         cmd = ["cargo", "install"]
@@ -37,7 +112,7 @@ def install_pyxis(
             cmd.extend(["--path", path])
             print(f"Installing pyxis from path: {path}")
         else:
-            cmd.extend(["--git", "https://github.com/ferrobrew/pyxis.git"])
+            cmd.extend(["--git", PYXIS_GIT_URL])
             if branch:
                 cmd.extend(["--branch", branch])
                 print(f"Installing pyxis from branch: {branch}")
@@ -53,95 +128,260 @@ def install_pyxis(
         print(f"Error installing pyxis: {e}", file=sys.stderr)
         sys.exit(1)
 
+    # Record what was installed; an install with no stable key (e.g. from a
+    # local path) replaces the binary, so it invalidates any previous stamp.
+    pyxis_fingerprint = get_pyxis_fingerprint()
+    try:
+        if install_key is not None and pyxis_fingerprint is not None:
+            stamp_file.parent.mkdir(parents=True, exist_ok=True)
+            stamp_file.write_text(
+                f"{install_key}\n{pyxis_fingerprint}\n", encoding="utf-8"
+            )
+        else:
+            stamp_file.unlink(missing_ok=True)
+    except OSError:
+        pass  # Only costs a redundant install next time
+
+
+# Flattens a project's relative path into its output directory name.
+_SEP_TABLE = str.maketrans({"/": "_", "\\": "_"})
+
+
+@dataclass(slots=True)
+class Project:
+    """A pyxis project to build, with its paths resolved once up front."""
+
+    output_name: str
+    toml_file: Path
+    input_dir: Path
+    output_dir: Path
+
+
+# Directories that never contain projects and can be large; don't descend.
+_SKIP_DIRS = {".git", "target", "node_modules"}
+
 
 def find_pyxis_toml_files(root_dir: Path) -> List[Path]:
-    """Find all pyxis.toml files in the repository."""
-    return list(root_dir.rglob("pyxis.toml"))
+    """Find all pyxis.toml files in the repository.
+
+    Walks with `os.scandir` rather than `Path.rglob`: the directory entry
+    type comes from readdir, so no per-entry stat or Path is needed."""
+    toml_files: List[Path] = []
+    stack = [str(root_dir)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.name == "pyxis.toml":
+                    toml_files.append(Path(entry.path))
+    return toml_files
+
+
+@functools.lru_cache(maxsize=1)
+def _init_windows_utf8() -> None:
+    """On Windows, switch the console and stderr to UTF-8 so pyxis's output
+    and non-ASCII paths display correctly. A no-op elsewhere, and after the
+    first call."""
+    if platform.system() != "Windows":
+        return
+    # Ensure console can handle UTF-8
+    if sys.stderr.isatty():
+        try:
+            # Try to set console code page to UTF-8
+            import ctypes
 
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetConsoleOutputCP(65001)  # UTF-8 code page
+        except Exception:
+            pass  # Ignore if we can't set it
+    try:
+        if sys.stderr.encoding != "utf-8":
+            sys.stderr.reconfigure(encoding="utf-8")
+    except Exception:
+        pass  # Ignore if reconfiguration fails
+
+
+def build_pyxis_project(
+    input_dir: Path, output_dir: Path, backend: str, env: Dict[str, str]
+) -> bool:
+    """Build a pyxis project and return True if successful. `env` is the
+    environment for the pyxis subprocess, shared across builds."""
+    # Spool output to temp files rather than pipes: on success it's never
+    # read, so there's nothing to drain or decode.
+    with tempfile.TemporaryFile() as stdout, tempfile.TemporaryFile() as stderr:
+        try:
+            subprocess.run(
+                [
+                    "pyxis",
+                    "build",
+                    "--backend",
+                    backend,
+                    str(input_dir),
+                    str(output_dir) + "/",
+                ],
+                check=True,
+                stdout=stdout,
+                stderr=stderr,
+                env=env,
+            )
+            return True
+        except subprocess.CalledProcessError:
+            print(f"Error building {input_dir}:", file=sys.stderr)
+            # Pass pyxis's UTF-8 output through as bytes, so it survives
+            # whatever encoding sys.stderr is configured with.
+            sys.stderr.flush()
+            for output in (stderr, stdout):
+                output.seek(0)
+                shutil.copyfileobj(output, sys.stderr.buffer)
+            sys.stderr.buffer.flush()
+            return False
+
+
+def build_project(project: Project, backend: str, env: Dict[str, str]) -> bool:
+    """Build one of the repository's projects into its output directory.
+    Runs on a build pool worker, so the progress line is printed when the
+    build actually starts rather than when it's queued."""
+    print(f"Building {project.input_dir} -> {project.output_dir}")
+    return build_pyxis_project(project.input_dir, project.output_dir, backend, env)
+
+
+# pyxis writes its top-level scalar fields before `items`, so they always
+# land within the first few hundred bytes of output.json.
+_JSON_HEADER_BYTES = 64 * 1024
+
+
+def read_json_header_strings(
+    json_file: Path, keys: List[str]
+) -> tuple[Dict[str, str], bool]:
+    """Find string fields near the start of a JSON file without parsing the
+    whole (possibly multi-megabyte) document, reading the file once. Fields
+    that aren't in the header are left out of the result.
+
+    Also returns whether the header is complete, i.e. it holds the whole
+    file or reaches `items`. If so, a missing field is genuinely absent;
+    otherwise the caller should fall back to `json.load`."""
+    with open(json_file, "rb") as f:
+        header = f.read(_JSON_HEADER_BYTES)
+    complete = (
+        len(header) < _JSON_HEADER_BYTES
+        or re.search(rb'"items"\s*:', header) is not None
+    )
+    fields: Dict[str, str] = {}
+    for key in keys:
+        pattern = rb'"' + re.escape(key.encode()) + rb'"\s*:\s*"((?:[^"\\]|\\.)*)"'
+        match = re.search(pattern, header)
+        if match is None:
+            continue
+        try:
+            fields[key] = json.loads(b'"' + match.group(1) + b'"')
+        except ValueError:
+            continue
+    return fields, complete
 
-def build_pyxis_project(input_dir: Path, output_dir: Path, backend: str) -> bool:
-    """Build a pyxis project and return True if successful."""
-    # On Windows, ensure UTF-8 encoding for subprocess output
-    env = os.environ.copy()
-    if platform.system() == "Windows":
-        env["PYTHONIOENCODING"] = "utf-8"
-        # Ensure console can handle UTF-8
-        if sys.stderr.isatty():
-            try:
-                # Try to set console code page to UTF-8
-                import ctypes
 
-                kernel32 = ctypes.windll.kernel32
-                kernel32.SetConsoleOutputCP(65001)  # UTF-8 code page
-            except Exception:
-                pass  # Ignore if we can't set it
+# Written into each output directory after a successful build; holds the
+# project_build_key the output was produced from and the output's own
+# fingerprint at that point.
+BUILD_KEY_FILE = ".build_key"
 
+
+def get_pyxis_fingerprint() -> Optional[str]:
+    """Identify the pyxis binary on PATH by its modification time and size,
+    so reinstalling it invalidates every build key. Returns None if pyxis
+    can't be found, which disables build caching."""
+    pyxis_path = shutil.which("pyxis")
+    if pyxis_path is None:
+        return None
+    stat = os.stat(pyxis_path)
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def project_build_key(input_dir: Path, backend: str, pyxis_fingerprint: str) -> str:
+    """Hash everything a project's output depends on: the names, modification
+    times and sizes of its input files, the backend, and the pyxis binary."""
+    h = hashlib.blake2b()
+    h.update(f"{pyxis_fingerprint}\0{backend}\0".encode("utf-8"))
+    _hash_tree_stats(h, input_dir)
+    return h.hexdigest()
+
+
+def output_fingerprint(output_dir: Path) -> str:
+    """Hash the names, modification times and sizes of a project's generated
+    files, so output that was since deleted, restored from Git or edited by
+    hand no longer counts as up to date."""
+    h = hashlib.blake2b()
+    _hash_tree_stats(h, output_dir, skip=BUILD_KEY_FILE)
+    return h.hexdigest()
+
+
+def _hash_tree_stats(h: Any, root: Path, skip: Optional[str] = None) -> None:
+    """Feed the relative path, mtime and size of every entry under root
+    (except one named `skip` at the top level) into a hash."""
+    for file in sorted(root.rglob("*")):
+        rel_path = file.relative_to(root).as_posix()
+        if rel_path == skip:
+            continue
+        stat = file.stat()
+        h.update(f"{rel_path}\0{stat.st_mtime_ns}\0{stat.st_size}\0".encode("utf-8"))
+
+
+def is_build_fresh(output_dir: Path, build_key: str) -> bool:
+    """Whether an output directory was produced from build_key and hasn't
+    changed since."""
     try:
-        subprocess.run(
-            [
-                "pyxis",
-                "build",
-                "--backend",
-                backend,
-                str(input_dir),
-                str(output_dir) + "/",
-            ],
-            check=True,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            env=env,
-        )
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error building {input_dir}:", file=sys.stderr)
-        # Ensure stderr can handle UTF-8 output on Windows
-        if platform.system() == "Windows":
-            try:
-                if sys.stderr.encoding != "utf-8":
-                    sys.stderr.reconfigure(encoding="utf-8")
-            except Exception:
-                pass  # Ignore if reconfiguration fails
-        if e.stderr:
-            print(e.stderr, file=sys.stderr, end="")
-        if e.stdout:
-            print(e.stdout, file=sys.stderr, end="")
+        recorded = (output_dir / BUILD_KEY_FILE).read_text(encoding="utf-8").split()
+    except OSError:
         return False
+    return recorded == [build_key, output_fingerprint(output_dir)]
 
 
-def get_project_name(json_file: Path) -> str:
-    """Extract project_name from the generated JSON file."""
+def write_build_key(output_dir: Path, build_key: str) -> None:
+    """Record the build key an output directory was produced from, along
+    with the output's current fingerprint."""
     try:
-        with open(json_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data.get("project_name", "")
-    except (json.JSONDecodeError, FileNotFoundError) as e:
-        print(f"Error reading {json_file}: {e}", file=sys.stderr)
-        return ""
+        (output_dir / BUILD_KEY_FILE).write_text(
+            f"{build_key}\n{output_fingerprint(output_dir)}\n", encoding="utf-8"
+        )
+    except OSError:
+        pass  # Only costs a rebuild next time
 
 
-def get_pyxis_version(json_file: Path) -> Optional[str]:
-    """Extract the pyxis version that generated this doc, if present.
+def get_doc_metadata(json_file: Path) -> tuple[str, Optional[str]]:
+    """Extract `project_name` and the pyxis version that generated this doc
+    from the generated JSON file, in a single read of its header.
 
     Older documents (schema < v6) don't carry `pyxis_version`; return None
-    so the index omits the field rather than lying with a placeholder.
+    for it so the index omits the field rather than lying with a placeholder.
+    `project_name` is an empty string if it can't be read. Raises
+    FileNotFoundError if the document doesn't exist.
     """
     try:
-        with open(json_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data.get("pyxis_version")
-    except (json.JSONDecodeError, FileNotFoundError) as e:
+        fields, complete = read_json_header_strings(
+            json_file, ["project_name", "pyxis_version"]
+        )
+        if "project_name" not in fields or (
+            "pyxis_version" not in fields and not complete
+        ):
+            with open(json_file, "r", encoding="utf-8") as f:
+                fields = json.load(f)
+        return fields.get("project_name", ""), fields.get("pyxis_version")
+    except json.JSONDecodeError as e:
         print(f"Error reading {json_file}: {e}", file=sys.stderr)
-        return None
+        return "", None
 
 
-def get_git_last_modified(path: Path) -> Optional[datetime]:
-    """Get the last modified timestamp from Git for a directory.
-    Returns None if no Git history is available."""
+@functools.lru_cache(maxsize=None)
+def get_git_last_modified(path: str) -> Optional[str]:
+    """Get the last modified timestamp from Git for a directory, formatted
+    by `parse_git_timestamp`. Returns None if no Git history is available.
+
+    Cached per path; pass a resolved path so aliases of the same directory
+    share an entry."""
     try:
         result = subprocess.run(
-            ["git", "log", "-1", "--format=%cI", "--", str(path)],
+            ["git", "log", "-1", "--format=%cI", "--", path],
             capture_output=True,
             text=True,
             check=False,
@@ -152,10 +392,22 @@ def get_git_last_modified(path: Path) -> Optional[datetime]:
     if result.returncode != 0:
         return None
 
-    git_timestamp_str = result.stdout.strip()
+    return parse_git_timestamp(result.stdout)
+
+
+def parse_git_timestamp(git_timestamp_str: str) -> Optional[str]:
+    """Normalize a `%cI` commit timestamp to UTC `YYYY-MM-DDTHH:MM:SSZ`.
+    Returns None if the string is empty or malformed.
+
+    These strings sort chronologically, so they can be compared directly."""
+    git_timestamp_str = git_timestamp_str.strip()
     if not git_timestamp_str:
         return None
 
+    # Already UTC: the date and time are usable as-is, no datetime needed
+    if len(git_timestamp_str) >= 20 and git_timestamp_str.endswith(("+00:00", "Z")):
+        return git_timestamp_str[:19] + "Z"
+
     try:
         # Parse the timestamp (handles various ISO 8601 formats)
         git_dt = datetime.fromisoformat(git_timestamp_str.replace("Z", "+00:00"))
@@ -164,8 +416,144 @@ def get_git_last_modified(path: Path) -> Optional[datetime]:
 
     # Convert to UTC if it has timezone info, otherwise assume UTC
     if git_dt.tzinfo is None:
-        return git_dt.replace(tzinfo=timezone.utc)
-    return git_dt.astimezone(timezone.utc)
+        return iso_z(git_dt)
+    return iso_z(git_dt.astimezone(timezone.utc))
+
+
+def iso_z(dt: datetime) -> str:
+    """Format a UTC datetime as `YYYY-MM-DDTHH:MM:SSZ`. Equivalent to
+    strftime with that pattern, minus the format-string parsing."""
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+        f"T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}Z"
+    )
+
+
+def available_cpu_count() -> int:
+    """Number of CPUs this process may run on. In containers and CI runners
+    `os.cpu_count()` reports every host core, which would oversubscribe the
+    build pool; the scheduler affinity mask reflects the actual limit."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def collect_git_last_modified(
+    project_dir: Path, input_dirs: List[Path]
+) -> Dict[Path, Optional[str]]:
+    """Get the last modified timestamp of each input directory, from one
+    batched `git log` pass if possible. If that fails, fall back to a query
+    per directory; those only read from `.git`, so they run concurrently."""
+    index = build_git_mtime_index(project_dir)
+    if index is not None:
+        return {input_dir: index.get(input_dir) for input_dir in input_dirs}
+    workers = min(32, available_cpu_count() * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        paths = [str(input_dir.resolve()) for input_dir in input_dirs]
+        return dict(zip(input_dirs, executor.map(get_git_last_modified, paths)))
+
+
+_GIT_LOG_CHUNK_BYTES = 1 << 20
+
+
+def build_git_mtime_index(project_dir: Path) -> Optional[Dict[Path, str]]:
+    """Map every file and directory under project_dir to the timestamp of the
+    last commit that touched it, using a single `git log` pass instead of one
+    per project. Returns None if Git isn't available or the log fails, so the
+    caller can fall back to `get_git_last_modified`."""
+    try:
+        # Paths are listed relative to the repository root (`--relative`
+        # doesn't apply to merge diffs), so strip project_dir's prefix.
+        prefix = subprocess.run(
+            ["git", "rev-parse", "--show-prefix"],
+            cwd=project_dir,
+            capture_output=True,
+            check=True,
+        ).stdout.rstrip(b"\n")
+        proc = subprocess.Popen(
+            [
+                "git", "log", "-z", "--name-only", "--no-renames", "-m",
+                "--format=format:%H %cI %P", "--", ".",
+            ],
+            cwd=project_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=_GIT_LOG_CHUNK_BYTES,
+        )
+    except (FileNotFoundError, NotADirectoryError, subprocess.CalledProcessError):
+        return None
+
+    # `git log` walks newest-first, so the first commit seen touching a path
+    # is the one a per-path `git log -1` would report. Renames are listed as
+    # a delete plus an add, so the directory a file moved out of sees the move
+    # too. `-m` lists a merge once per parent; a per-path log reports a merge
+    # only when the path differs from every parent, so a merge touches the
+    # files and directories common to all of its per-parent lists.
+    #
+    # With `-z`, paths are NUL-terminated and never quoted, and records are
+    # separated by an empty entry. Each record is a header line (hash,
+    # timestamp, parents), then its paths. The stream is consumed as raw bytes
+    # in large chunks and split in bulk.
+    touched_at: Dict[bytes, str] = {}
+    commit: Optional[bytes] = None
+    commit_time: Optional[str] = None
+    parent_count = 0
+    touched: List[Set[bytes]] = []
+
+    def flush_commit() -> None:
+        # A parent with no differences is omitted, so a short list means the
+        # merge left everything as that parent had it.
+        if commit_time is None or len(touched) < max(parent_count, 1):
+            return
+        for key in set.intersection(*touched):
+            touched_at.setdefault(key, commit_time)
+
+    pending = b""
+    with proc:
+        while True:
+            chunk = proc.stdout.read(_GIT_LOG_CHUNK_BYTES)
+            records = (pending + chunk).split(b"\0\0")
+            # Hold back the trailing partial record until the next chunk.
+            pending = records.pop() if chunk else b""
+            for record in records:
+                header, _, names = record.partition(b"\n")
+                record_commit, timestamp, *parents = header.split()
+                if record_commit != commit:
+                    flush_commit()
+                    commit = record_commit
+                    commit_time = parse_git_timestamp(timestamp.decode("ascii"))
+                    parent_count = len(parents)
+                    touched = []
+                keys: Set[bytes] = set()
+                for name in names.split(b"\0"):
+                    if not name or not name.startswith(prefix):
+                        continue
+                    # The file itself, then every directory above it up to
+                    # project_dir (the empty path).
+                    name = name[len(prefix):]
+                    while name not in keys:
+                        keys.add(name)
+                        name = name[:max(name.rfind(b"/"), 0)]
+                touched.append(keys)
+            if not chunk:
+                break
+    flush_commit()
+    if proc.returncode != 0:
+        return None
+
+    return {
+        project_dir / os.fsdecode(key): timestamp
+        for key, timestamp in touched_at.items()
+    }
+
+
+def dump_index_json(index_data: Dict[str, Any]) -> bytes:
+    """Serialize index.json as UTF-8 with 2-space indentation. Uses orjson
+    when it's installed; the stdlib fallback produces identical bytes, so the
+    checked-in index doesn't churn depending on which one ran."""
+    if orjson is not None:
+        return orjson.dumps(index_data, option=orjson.OPT_INDENT_2)
+    return json.dumps(index_data, indent=2, ensure_ascii=False).encode("utf-8")
 
 
 # --- Build verification (compile the generated Rust/C++ output) ----------
@@ -272,7 +660,7 @@ def rust_target_for_pointer_size(pointer_size: int) -> str:
 
 
 def generate_rust_crate(
-    rel_path: str, input_dir: Path, work_dir: Path
+    rel_path: str, input_dir: Path, work_dir: Path, env: Dict[str, str]
 ) -> Optional[Dict[str, Any]]:
     """Generate a project's Rust output into a crate directory and write its
     Cargo.toml. Returns the crate metadata (name, target, features to enable)
@@ -286,15 +674,7 @@ def generate_rust_crate(
     src_dir.mkdir(parents=True, exist_ok=True)
     # Generate at the crate root (root module -> src/lib.rs), matching how a
     # consumer mounts the whole project.
-    gen = subprocess.run(
-        [
-            "pyxis", "build", "--backend", "rust",
-            str(input_dir), str(src_dir) + "/",
-        ],
-        capture_output=True, text=True, encoding="utf-8", errors="replace",
-    )
-    if gen.returncode != 0:
-        print(gen.stderr, file=sys.stderr, end="")
+    if not build_pyxis_project(input_dir, src_dir, "rust", env):
         return None
     (work_dir / "Cargo.toml").write_text(
         rust_check_cargo_toml(crate_name, config), encoding="utf-8"
@@ -334,7 +714,9 @@ def workspace_cargo_toml(members: List[str]) -> str:
     )
 
 
-def check_cpp_build(input_dir: Path, work_dir: Path) -> Optional[bool]:
+def check_cpp_build(
+    input_dir: Path, work_dir: Path, env: Dict[str, str]
+) -> Optional[bool]:
     """Generate a project's C++ output and build it with CMake. The build
     toolchain is the environment's responsibility (vanilla MSVC on Windows,
     or clang-cl + xwin on Linux); point at one per architecture via
@@ -350,12 +732,7 @@ def check_cpp_build(input_dir: Path, work_dir: Path) -> Optional[bool]:
 
     out_dir = work_dir / "out"
     out_dir.mkdir(parents=True, exist_ok=True)
-    gen = subprocess.run(
-        ["pyxis", "build", "--backend", "cpp", str(input_dir), str(out_dir) + "/"],
-        capture_output=True, text=True, encoding="utf-8", errors="replace",
-    )
-    if gen.returncode != 0:
-        print(gen.stderr, file=sys.stderr, end="")
+    if not build_pyxis_project(input_dir, out_dir, "cpp", env):
         return False
 
     build_dir = work_dir / "build"
@@ -380,14 +757,15 @@ def check_cpp_build(input_dir: Path, work_dir: Path) -> Optional[bool]:
 
 
 def check_all_builds(
-    repo_root: Path, backends: List[str], output_dir: Optional[Path] = None
+    repo_root: Path,
+    backends: List[str],
+    env: Dict[str, str],
+    output_dir: Optional[Path] = None,
 ) -> None:
     """Compile-check the generated output for every project. Exits non-zero
     if any project fails to build. If output_dir is provided, artifacts are
-    persisted there; otherwise a temp directory is used and deleted on exit."""
-    import tempfile
-    import shutil
-
+    persisted there; otherwise a temp directory is used and deleted on exit.
+    `env` is the environment for the pyxis subprocesses."""
     project_dir = repo_root / "projects"
     toml_files = sorted(find_pyxis_toml_files(project_dir))
     failures: List[str] = []
@@ -421,7 +799,7 @@ def check_all_builds(
                 name = rel_path.replace("/", "_")
                 work_dir = tmp_path / f"{name}-rust"
                 print(f"== generating Rust crate: {name} ==")
-                crate_meta = generate_rust_crate(rel_path, input_dir, work_dir)
+                crate_meta = generate_rust_crate(rel_path, input_dir, work_dir, env)
                 if crate_meta is None:
                     failures.append(f"{name} (rust)")
                 else:
@@ -445,7 +823,7 @@ def check_all_builds(
                 name = rel_path.replace("/", "_")
                 print(f"== checking C++ build: {name} ==")
                 work_dir = tmp_path / f"{name}-cpp"
-                if check_cpp_build(input_dir, work_dir) is False:
+                if check_cpp_build(input_dir, work_dir, env) is False:
                     failures.append(f"{name} (cpp)")
 
         if failures:
@@ -495,6 +873,16 @@ def main():
     parser.add_argument(
         "--no-install", action="store_true", help="Do not install pyxis"
     )
+    parser.add_argument(
+        "--force-install",
+        action="store_true",
+        help="Reinstall pyxis even if the install stamp says it's up to date",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rebuild every project, even those whose inputs are unchanged",
+    )
     parser.add_argument(
         "--backend",
         type=str,
@@ -530,9 +918,22 @@ def main():
     if specified > 1:
         parser.error("Only one of --branch, --tag, --rev, or --path can be specified")
 
+    _init_windows_utf8()
+    # Environment shared by every pyxis build; on Windows, ensure UTF-8
+    # encoding for subprocess output
+    build_env = os.environ.copy()
+    if platform.system() == "Windows":
+        build_env["PYTHONIOENCODING"] = "utf-8"
+
     # Check for required tools
     if not args.no_install:
-        install_pyxis(branch=args.branch, tag=args.tag, rev=args.rev, path=args.path)
+        install_pyxis(
+            branch=args.branch,
+            tag=args.tag,
+            rev=args.rev,
+            path=args.path,
+            force=args.force_install,
+        )
 
     # Get repository root
     repo_root = Path(__file__).parent.resolve()
@@ -541,7 +942,7 @@ def main():
     if args.check_builds:
         backends = [b.strip() for b in args.check_builds.split(",") if b.strip()]
         output_dir = Path(args.output_dir) if args.output_dir else None
-        check_all_builds(repo_root, backends, output_dir)
+        check_all_builds(repo_root, backends, build_env, output_dir)
         return
 
     backend = args.backend
@@ -561,40 +962,86 @@ def main():
         print("No pyxis.toml files found.")
         sys.exit(1)
 
-    # Build array of (output_name, toml_path) tuples
-    projects: List[tuple[str, Path]] = []
+    # Resolve every project's paths once, up front. find_pyxis_toml_files
+    # joins entry names onto str(project_dir), so each relative path is a
+    # plain string slice.
+    project_dir_prefix = str(project_dir) + os.sep
+    projects: List[Project] = []
     for toml_file in toml_files:
         input_dir = toml_file.parent
-        rel_path = input_dir.relative_to(project_dir)
-        output_name = str(rel_path).replace(os.sep, "_").replace("/", "_")
-        projects.append((output_name, toml_file))
+        rel_path = str(input_dir)[len(project_dir_prefix):]
+        output_name = rel_path.translate(_SEP_TABLE)
+        output_dir = output_base_dir / output_name
+        projects.append(Project(output_name, toml_file, input_dir, output_dir))
 
     # Sort by output_name
-    projects.sort(key=lambda x: x[0])
-
-    documents: List[Dict[str, Any]] = []
-
-    # Process each project
-    for output_name, toml_file in projects:
-        input_dir = toml_file.parent
-        output_dir = output_base_dir / output_name
+    projects.sort(key=lambda p: p.output_name)
+
+    # Projects whose inputs, backend and pyxis binary are unchanged since
+    # their last build are skipped and keep their previous output.
+    pyxis_fingerprint = None if args.no_cache else get_pyxis_fingerprint()
+
+    # Build every project concurrently. The work happens in `pyxis build`
+    # subprocesses, so threads are enough: the GIL is released while each
+    # one waits on its child. Git timestamps are collected alongside the
+    # builds on a thread of their own, so they don't take up a build slot.
+    with ThreadPoolExecutor(max_workers=1) as git_executor, ThreadPoolExecutor(
+        max_workers=available_cpu_count()
+    ) as executor:
+        git_times: Optional[Future[Dict[Path, Optional[str]]]] = None
+        if backend == "json":
+            git_times = git_executor.submit(
+                collect_git_last_modified,
+                project_dir,
+                [project.input_dir for project in projects],
+            )
 
-        print(f"Building {input_dir} -> {output_dir}")
+        builds: Dict[Future[bool], tuple[Project, Optional[str]]] = {}
+        for project in projects:
+            build_key = None
+            if pyxis_fingerprint is not None:
+                build_key = project_build_key(
+                    project.input_dir, backend, pyxis_fingerprint
+                )
+                if is_build_fresh(project.output_dir, build_key):
+                    print(f"Up to date: {project.input_dir}")
+                    continue
+            future = executor.submit(build_project, project, backend, build_env)
+            builds[future] = (project, build_key)
+
+        # Fail fast: stop as soon as any build reports failure, cancelling
+        # whatever hasn't started yet.
+        for future in as_completed(builds):
+            project, build_key = builds[future]
+            try:
+                built = future.result()
+            except Exception as e:
+                print(f"Error building {project.input_dir}: {e}", file=sys.stderr)
+                built = False
+            if not built:
+                executor.shutdown(wait=True, cancel_futures=True)
+                print(f"Error: Failed to build {project.input_dir}", file=sys.stderr)
+                sys.exit(1)
+            if build_key is not None:
+                write_build_key(project.output_dir, build_key)
 
-        # Build with pyxis
-        if not build_pyxis_project(input_dir, output_dir, backend):
-            print(f"Error: Failed to build {input_dir}", file=sys.stderr)
-            sys.exit(1)
+    last_modified = git_times.result() if git_times is not None else {}
+    documents: List[Dict[str, Any]] = []
 
+    # Collect metadata in `projects` order so index.json is stable
+    for project in projects:
         # For JSON backend, collect metadata for index generation
         if backend == "json":
-            # Extract project_name from the generated JSON
-            json_file = output_dir / "output.json"
-            if not json_file.exists():
+            json_file = project.output_dir / "output.json"
+
+            # Extract project_name and which pyxis generated this doc (None
+            # for schema < v6). This is the only read of the doc, so it
+            # doubles as the check that the build produced one.
+            try:
+                project_name, pyxis_version = get_doc_metadata(json_file)
+            except FileNotFoundError:
                 print(f"Error: {json_file} not found after build", file=sys.stderr)
                 sys.exit(1)
-
-            project_name = get_project_name(json_file)
             if not project_name:
                 print(
                     f"Error: Could not extract project_name from {json_file}",
@@ -602,17 +1049,8 @@ def main():
                 )
                 sys.exit(1)
 
-            # Get last modified timestamp from Git
-            last_modified_dt = get_git_last_modified(input_dir)
-            # Convert to ISO8601 string if available, otherwise None
-            last_modified_iso8601 = (
-                last_modified_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
-                if last_modified_dt is not None
-                else None
-            )
-
-            # Which pyxis generated this doc (None for schema < v6).
-            pyxis_version = get_pyxis_version(json_file)
+            # Last modified timestamp from Git (None if unavailable)
+            last_modified_iso8601 = last_modified[project.input_dir]
 
             # Get relative path to JSON from repo root
             json_path = json_file.relative_to(repo_root)
@@ -632,15 +1070,15 @@ def main():
     # Generate index.json only for JSON backend
     if backend == "json":
         # Generate current timestamp in ISO 8601 format
-        generated_iso8601 = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        generated_iso8601 = iso_z(datetime.now(timezone.utc))
 
         # Build the index.json
         index_data = {"generated_iso8601": generated_iso8601, "docs": documents}
 
         index_file = output_base_dir / "index.json"
         try:
-            with open(index_file, "w", encoding="utf-8") as f:
-                json.dump(index_data, f, indent=2, ensure_ascii=False)
+            with open(index_file, "wb") as f:
+                f.write(dump_index_json(index_data))
         except (IOError, OSError) as e:
             print(f"Error: Failed to write {index_file}: {e}", file=sys.stderr)
             sys.exit(1)